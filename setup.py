@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Packaging for SnapHero.
+
+When mypyc is importable at build time (pip install mypy), snaphero.py is
+also compiled to a native extension for faster start-up. Python imports the
+compiled module in preference to snaphero.py, which is always installed as
+the pure-Python fallback. Set SNAPHERO_PURE_PYTHON=1 to skip compilation.
+
+    pip install .                                  # pure Python
+    pip install mypy && pip install --no-build-isolation .   # compiled
+"""
+
+import os
+import re
+from setuptools import setup
+
+with open("snaphero.py", encoding="utf-8") as f:
+    version = re.search(r'^VERSION = "([^"]+)"', f.read(), re.MULTILINE).group(1)
+
+ext_modules = []
+if not os.environ.get("SNAPHERO_PURE_PYTHON"):
+    try:
+        from mypyc.build import mypycify
+    except ImportError:
+        pass
+    else:
+        # Options come from mypy.ini. Only snaphero.py is compiled: the
+        # Numba kernels in snaphero_kernels.py must stay plain Python, and
+        # mypyc mis-compiles the coroutines in snaphero_async.py.
+        ext_modules = mypycify(["snaphero.py"])
+
+setup(
+    name="snaphero",
+    version=version,
+    description="A powerful website screenshot utility with advanced features.",
+    author="coldman07(vibhu)",
+    license="GPL-3.0",
+    py_modules=["snaphero", "snaphero_async", "snaphero_kernels"],
+    ext_modules=ext_modules,
+    python_requires=">=3.9",
+    install_requires=[
+        "playwright",
+        "pyfiglet",
+        "Pillow",
+    ],
+    extras_require={
+        "post": ["numpy", "numba"],
+        "uring": ["liburing"],
+    },
+    entry_points={
+        "console_scripts": [
+            "snaphero=snaphero:main",
+        ],
+    },
+)
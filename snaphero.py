@@ -13,21 +13,119 @@ For detailed help, run:
 """
 
 import argparse
+import errno
+import importlib.util
+import io
 import time
-import subprocess
 import sys
 import os
+import queue
+import threading
 from pathlib import Path
-from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
-from datetime import datetime
+from typing import Any, Optional, Sequence
+from urllib.parse import urlparse
 
 VERSION = "2.0.0"
 
+# Viewport sizes selected with --device (or the --mobile/--tablet aliases)
+DEVICE_PRESETS = {
+    'mobile': (375, 667),   # iPhone SE
+    'tablet': (768, 1024),  # iPad
+}
+
+DEFAULT_VIEWPORT = (1280, 720)
+
+# Pixel post-processing steps accepted by --post
+POST_PROCESSORS = ('invert', 'grayscale')
+
+# Buffer and length alignment required by O_DIRECT writes (--direct-io)
+DIRECT_IO_ALIGNMENT = 4096
+
+# Seconds the --serve server waits on a silent client before dropping it
+SERVER_IDLE_TIMEOUT = 60
+
+# Registered as a context init script so the browser parses it once and it
+# runs on every navigation; a single grouped selector walks the DOM once and
+# all layout reads happen before any style writes to avoid layout thrashing.
+# Consent managers usually inject banners after load, so a MutationObserver
+# watches for added nodes and, at most once per frame, measures only the
+# added elements that match the selector instead of re-scanning the page.
+COOKIE_BANNER_SELECTOR = ','.join([
+    '[class*="cookie"]', '[id*="cookie"]',
+    '[class*="consent"]', '[id*="consent"]',
+    '[class*="gdpr"]', '[id*="gdpr"]',
+    '[aria-label*="cookie"]', '[aria-label*="consent"]'
+])
+
+HIDE_COOKIE_BANNERS_JS = """
+(() => {
+    const selector = '%s';
+    const hide = (candidates) => {
+        const banners = candidates
+            .filter(el => el.isConnected && el.getBoundingClientRect().height > 50);
+        banners.forEach(el => { el.style.display = 'none'; });
+    };
+    const hideAll = () => hide(Array.from(document.querySelectorAll(selector)));
+    let added = [];
+    let scheduled = false;
+    const collect = (mutations) => {
+        for (const mutation of mutations) {
+            for (const node of mutation.addedNodes) {
+                if (node.nodeType !== Node.ELEMENT_NODE) continue;
+                if (node.matches(selector)) added.push(node);
+                added.push(...node.querySelectorAll(selector));
+            }
+        }
+        if (scheduled || !added.length) return;
+        scheduled = true;
+        requestAnimationFrame(() => {
+            const candidates = added;
+            added = [];
+            scheduled = false;
+            hide(candidates);
+        });
+    };
+    document.addEventListener('DOMContentLoaded', () => {
+        hideAll();
+        new MutationObserver(collect).observe(document.documentElement, {
+            childList: true, subtree: true
+        });
+    });
+    window.addEventListener('load', hideAll);
+})();
+""" % COOKIE_BANNER_SELECTOR
+
+# Playwright request resource types accepted by --block-resources
+RESOURCE_TYPES = (
+    'document', 'stylesheet', 'image', 'media', 'font', 'script', 'texttrack',
+    'xhr', 'fetch', 'eventsource', 'websocket', 'manifest', 'other'
+)
+
+# Hosts (and their subdomains) aborted by --block-trackers
+TRACKER_HOSTS = (
+    'doubleclick.net', 'google-analytics.com', 'googletagmanager.com',
+    'googlesyndication.com', 'googleadservices.com', 'adservice.google.com',
+    'facebook.net', 'connect.facebook.net', 'scorecardresearch.com',
+    'hotjar.com', 'segment.io', 'mixpanel.com', 'quantserve.com', 'criteo.com',
+    'taboola.com', 'outbrain.com', 'adnxs.com', 'amazon-adsystem.com'
+)
+
+def _default_socket():
+    """Unix socket used by --serve when $SNAPHERO_SOCK is not set."""
+    import tempfile
+    
+    return os.path.join(tempfile.gettempdir(), "snaphero.sock")
+
 def show_banner():
-    """Display a banner in the terminal using figlet."""
+    """Display a banner in the terminal using pyfiglet."""
+    # Skip the banner when output is piped/redirected or explicitly disabled
+    if not sys.stdout.isatty() or os.environ.get('SNAPHERO_NO_BANNER'):
+        return
+    
     try:
-        subprocess.run(["figlet", "-f", "slant", "SnapHero"], check=True)
-        subprocess.run(["figlet", "-f", "small", f"v{VERSION} - by coldman07(vibhu)"], check=True)
+        from pyfiglet import Figlet
+        print(Figlet(font='slant').renderText('SnapHero'), end='')
+        print(Figlet(font='small').renderText(f"v{VERSION} - by coldman07(vibhu)"))
     except Exception:
         print(f"=== SnapHero v{VERSION} ===")
         print("Created by coldman07(vibhu)\n")
@@ -72,13 +170,18 @@ VIEWPORT OPTIONS:
         Set browser viewport height (default: 720)
         Example: --viewport-height 1080
 
+    --device NAME
+        Use a device viewport preset instead of --viewport-width and
+        --viewport-height:
+            mobile   375x667   (iPhone SE)
+            tablet   768x1024  (iPad)
+        Example: --device tablet
+
     --mobile
-        Use mobile device viewport (375x667)
-        Emulates iPhone SE
+        Alias for --device mobile
 
     --tablet
-        Use tablet device viewport (768x1024)
-        Emulates iPad
+        Alias for --device tablet
 
 QUALITY OPTIONS:
     --quality LEVEL
@@ -86,6 +189,19 @@ QUALITY OPTIONS:
         Only applies to .jpg/.jpeg files
         Example: --quality 90
 
+    --png-compress LEVEL
+        Re-encode PNG files with Pillow at zlib level 0-9. By default the
+        PNG produced by the browser is saved as is; re-encoding decodes
+        and encodes the image again, so only use it to trade CPU for a
+        smaller (high level) file. Requires Pillow.
+        Example: --png-compress 9
+
+    --direct-io
+        Write screenshots with O_DIRECT so large full-page captures do not
+        fill the page cache (Linux only). Falls back to regular writes on
+        filesystems that do not support it. Not available with
+        --io-backend uring.
+
     --scale FACTOR
         Device scale factor for higher resolution (default: 1)
         Use 2 for Retina/HiDPI displays
@@ -96,6 +212,13 @@ ADVANCED FEATURES:
         Enable dark mode for the page
         Useful for dark theme screenshots
 
+    --post STEPS
+        Comma-separated pixel post-processing applied to the screenshot,
+        in order: invert, grayscale. Requires NumPy and Pillow; uses Numba
+        to JIT-compile the pixel loops when it is installed (the compiled
+        loops are cached on disk after the first run).
+        Example: --post grayscale
+
     --hide-cookie-banners
         Attempt to hide common cookie consent banners
         Uses CSS to hide typical banner elements
@@ -108,10 +231,25 @@ ADVANCED FEATURES:
         Page load timeout in milliseconds (default: 15000)
         Example: --timeout 30000
 
+    --wait-until EVENT
+        Navigation event to wait for before capturing: load,
+        domcontentloaded, networkidle or commit
+        (default: domcontentloaded, or load when --full-page is used)
+        Example: --wait-until networkidle
+
     --user-agent STRING
         Custom user agent string
         Example: --user-agent "Mozilla/5.0 Custom Bot"
 
+    --block-resources TYPES
+        Comma-separated request types to skip downloading. Useful when only
+        the layout matters. Types: document, stylesheet, image, media, font,
+        script, texttrack, xhr, fetch, eventsource, websocket, manifest, other
+        Example: --block-resources image,font,media
+
+    --block-trackers
+        Skip requests to common analytics, tracking and ad hosts
+
 BATCH PROCESSING:
     --batch FILE
         Capture multiple URLs from a text file (one URL per line)
@@ -121,6 +259,43 @@ BATCH PROCESSING:
         Prefix for batch output files (default: "screenshot_")
         Example: --batch-prefix "site_"
 
+    --skip-existing
+        Resume an interrupted batch: output files are named after the
+        domain plus a short hash of the URL instead of a timestamp and line
+        number, and URLs whose screenshot already exists are skipped. The
+        URL list may be trimmed or extended between runs.
+        Duplicate URLs in the file are always captured only once.
+        Example: --skip-existing
+
+    --io-backend BACKEND
+        How batch screenshots are written to disk (default: posix).
+        "uring" collects up to 8 encoded screenshots and writes them with
+        a single io_uring submission (Linux 5.10+, pip install liburing),
+        so files appear on disk in groups rather than one by one.
+        Applies to --batch when --workers is 1; cannot be combined
+        with --direct-io.
+        Example: --io-backend uring
+
+    --workers COUNT
+        Number of URLs to capture in parallel, each in its own browser
+        (default: 1). With a single worker one browser is reused for the
+        whole batch.
+        Example: --workers 4
+
+    --concurrency COUNT
+        Number of pages loaded concurrently inside a single browser
+        (default: 1). Overlaps network waits without extra processes.
+        Ignored when --workers is greater than 1.
+        Example: --concurrency 8
+
+SERVER MODE:
+    --serve
+        Start a persistent capture server that keeps Chromium warm and
+        listens on the Unix socket named by $SNAPHERO_SOCK (default:
+        {socket}). When $SNAPHERO_SOCK is set, single captures are sent
+        to the running server instead of launching a new browser.
+        Example: SNAPHERO_SOCK=/tmp/snaphero.sock python snaphero.py --serve
+
 INFORMATION:
     --manual
         Display this comprehensive manual
@@ -143,11 +318,13 @@ NOTES:
     • Supports PNG and JPEG formats
     • Use --full-page for long pages
     • Add --delay for JavaScript-heavy sites
+    • The banner is skipped when output is not a terminal; set
+      SNAPHERO_NO_BANNER=1 to always hide it
 
 AUTHOR:
     Created by coldman07(vibhu)
-    Version: 2.1
-""".format(version=VERSION)
+    Version: {version}
+""".format(version=VERSION, socket=_default_socket())
     print(manual)
 
 def show_examples():
@@ -164,7 +341,7 @@ def show_examples():
    python snaphero.py --url https://www.example.com --full-page --output full.png
 
 3. MOBILE VIEWPORT:
-   python snaphero.py --url https://www.example.com --mobile
+   python snaphero.py --url https://www.example.com --device mobile
 
 4. HIGH-QUALITY SCREENSHOT WITH DELAY:
    python snaphero.py --url https://www.example.com --delay 3 --quality 95 --output high-quality.jpg
@@ -185,12 +362,15 @@ def show_examples():
    python snaphero.py --url https://www.example.com --hide-cookie-banners --full-page
 
 10. BATCH CAPTURE FROM FILE:
-    python snaphero.py --batch urls.txt --batch-prefix "site_" --full-page
+    python snaphero.py --batch urls.txt --batch-prefix "site_" --full-page --workers 4
 
-11. CUSTOM USER AGENT:
+11. FAST LAYOUT CAPTURE (NO IMAGES, FONTS OR TRACKERS):
+    python snaphero.py --url https://www.example.com --block-resources image,font,media --block-trackers
+
+12. CUSTOM USER AGENT:
     python snaphero.py --url https://www.example.com --user-agent "CustomBot/1.0"
 
-12. FULL FEATURED CAPTURE:
+13. FULL FEATURED CAPTURE:
     python snaphero.py --url https://www.example.com \\
         --output screenshot.png \\
         --full-page \\
@@ -201,6 +381,11 @@ def show_examples():
         --hide-cookie-banners \\
         --dark-mode
 
+14. PERSISTENT SERVER (NO BROWSER START-UP PER CAPTURE):
+    export SNAPHERO_SOCK=/tmp/snaphero.sock
+    python snaphero.py --serve &
+    python snaphero.py --url https://www.example.com --output example.png
+
 BATCH FILE EXAMPLE (urls.txt):
     https://www.example.com
     https://www.github.com
@@ -210,10 +395,197 @@ TIP: Use --manual to see all available options and detailed descriptions.
 """
     print(examples)
 
-def capture_screenshot(url, output_file="screenshot.png", full_page=False, delay=0, 
-                      viewport_width=1280, viewport_height=720, quality=80, scale=1,
-                      dark_mode=False, hide_cookie_banners=False, wait_for_selector=None,
-                      timeout=15000, user_agent=None):
+def _build_context_options(viewport_width=1280, viewport_height=720, scale=1,
+                           dark_mode=False, user_agent=None):
+    """Build the browser context options shared by single and batch capture."""
+    context_options = {
+        'viewport': {'width': viewport_width, 'height': viewport_height},
+        'device_scale_factor': scale
+    }
+    
+    if dark_mode:
+        context_options['color_scheme'] = 'dark'
+    
+    if user_agent:
+        context_options['user_agent'] = user_agent
+    
+    return context_options
+
+def _should_block(request, block_resources=(), block_trackers=False):
+    """Return True if a request should be aborted instead of fetched."""
+    if request.resource_type in block_resources:
+        return True
+    
+    if block_trackers:
+        host = urlparse(request.url).hostname or ''
+        return any(host == tracker or host.endswith('.' + tracker) for tracker in TRACKER_HOSTS)
+    
+    return False
+
+def _setup_context(context, hide_cookie_banners=False, block_resources=(), block_trackers=False):
+    """Install init scripts and request routing on a freshly created context."""
+    if hide_cookie_banners:
+        context.add_init_script(HIDE_COOKIE_BANNERS_JS)
+    
+    # Routing intercepts every request, so only install it when something is blocked
+    if block_resources or block_trackers:
+        context.route("**/*", lambda route: route.abort()
+                      if _should_block(route.request, block_resources, block_trackers)
+                      else route.continue_())
+
+def _is_jpeg(output_file):
+    """Return True if output_file should be written as JPEG rather than PNG."""
+    return output_file.lower().endswith(('.jpg', '.jpeg'))
+
+def _post_process(image, post):
+    """Apply the named post-processing steps, in order, to a Pillow image."""
+    import numpy as np
+    from PIL import Image
+    from snaphero_kernels import KERNELS
+    
+    pixels = np.array(image.convert('RGBA'))
+    
+    for name in post:
+        KERNELS[name](pixels)
+    
+    return Image.fromarray(pixels, 'RGBA')
+
+def _encode_screenshot(data, output_file, png_compress=None, post=(), quality=80):
+    """
+    Post-process and re-encode screenshot bytes with Pillow.
+
+    PNGs are re-encoded at the given zlib level. JPEG bytes are already
+    encoded by Playwright with the requested quality and are only re-encoded
+    when post-processing changed the pixels. Without Pillow the bytes are
+    returned unchanged.
+    """
+    is_jpeg = _is_jpeg(output_file)
+    
+    if not post and (png_compress is None or is_jpeg):
+        return data
+    
+    try:
+        from PIL import Image
+    except ImportError:
+        return data
+    
+    image = Image.open(io.BytesIO(data))
+    
+    if post:
+        image = _post_process(image, post)
+    
+    buffer = io.BytesIO()
+    if is_jpeg:
+        image.convert('RGB').save(buffer, format='JPEG', quality=quality)
+    else:
+        image.save(buffer, format='PNG', optimize=False,
+                   compress_level=6 if png_compress is None else png_compress)
+    return buffer.getvalue()
+
+def _write_direct(path, data):
+    """
+    Write bytes with O_DIRECT so large captures bypass the page cache.
+
+    O_DIRECT needs aligned buffers and lengths, so the data is copied into a
+    page-aligned anonymous mmap padded to DIRECT_IO_ALIGNMENT and the file is
+    truncated back to its real size afterwards. Raises OSError with EINVAL on
+    filesystems that do not support O_DIRECT.
+    """
+    import mmap
+    
+    size = len(data)
+    padded = max(DIRECT_IO_ALIGNMENT, -(-size // DIRECT_IO_ALIGNMENT) * DIRECT_IO_ALIGNMENT)
+    
+    with mmap.mmap(-1, padded) as buffer:
+        buffer[:size] = data
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_DIRECT, 0o644)
+        
+        try:
+            with memoryview(buffer) as view:
+                written = 0
+                while written < padded:
+                    written += os.write(fd, view[written:])
+            os.ftruncate(fd, size)
+        finally:
+            os.close(fd)
+
+def _write_file(path, data, direct_io=False):
+    """Write bytes to path, bypassing the page cache on Linux when direct_io is set."""
+    if direct_io and sys.platform.startswith('linux'):
+        try:
+            _write_direct(path, data)
+            return
+        except OSError as e:
+            # Filesystems such as tmpfs reject O_DIRECT; use a buffered write instead
+            if e.errno != errno.EINVAL:
+                raise
+    
+    Path(path).write_bytes(data)
+
+def _save_screenshot(output_file, data, png_compress=None, post=(), quality=80,
+                     direct_io=False):
+    """Encode screenshot bytes for the output format and write them to disk."""
+    data = _encode_screenshot(data, output_file, png_compress, post, quality)
+    _write_file(output_file, data, direct_io)
+    print(f"✅ Screenshot saved: {output_file} ({len(data):,} bytes)")
+
+def _capture_on_page(page, url, output_file, full_page=False, delay=0, quality=80,
+                     wait_for_selector=None, timeout=15000, wait_until="load",
+                     png_compress=None, post=(), direct_io=False, save=_save_screenshot):
+    """
+    Load a URL in an already open page and save a screenshot of it.
+
+    Errors are left to the caller so that a single browser can be reused
+    across many captures. The raw screenshot bytes are handed to
+    save(output_file, data, png_compress, post, quality, direct_io), which
+    post-processes, encodes and writes them.
+    """
+    print(f"🌐 Loading {url}...")
+    page.goto(url, timeout=timeout, wait_until=wait_until)
+    
+    if wait_for_selector:
+        print(f"⏳ Waiting for selector: {wait_for_selector}")
+        page.wait_for_selector(wait_for_selector, timeout=timeout)
+    
+    if delay > 0:
+        print(f"⏱️  Waiting {delay} seconds...")
+        time.sleep(delay)
+    
+    # One call site per format so no options dict is built for every capture
+    if _is_jpeg(output_file):
+        data = page.screenshot(full_page=full_page, type='jpeg', quality=quality)
+    else:
+        data = page.screenshot(full_page=full_page, type='png')
+    
+    save(output_file, data, png_compress, post, quality, direct_io)
+
+def _capture_on_browser(browser, url, output_file="screenshot.png", viewport_width=1280,
+                        viewport_height=720, scale=1, dark_mode=False, user_agent=None,
+                        hide_cookie_banners=False, block_resources=(), block_trackers=False,
+                        **kwargs):
+    """
+    Capture a URL in a fresh context of an already running browser.
+
+    The context is closed afterwards so cookies and storage never leak
+    between captures. Errors are left to the caller.
+    """
+    context = browser.new_context(**_build_context_options(
+        viewport_width, viewport_height, scale, dark_mode, user_agent))
+    
+    try:
+        _setup_context(context, hide_cookie_banners, block_resources, block_trackers)
+        _capture_on_page(context.new_page(), url, output_file, **kwargs)
+    finally:
+        context.close()
+
+def capture_screenshot(url: str, output_file: str = "screenshot.png", full_page: bool = False,
+                      delay: float = 0, viewport_width: int = 1280, viewport_height: int = 720,
+                      quality: int = 80, scale: float = 1, dark_mode: bool = False,
+                      hide_cookie_banners: bool = False, wait_for_selector: Optional[str] = None,
+                      timeout: int = 15000, user_agent: Optional[str] = None,
+                      wait_until: str = "load", block_resources: Sequence[str] = (),
+                      block_trackers: bool = False, png_compress: Optional[int] = None,
+                      post: Sequence[str] = (), direct_io: bool = False) -> None:
     """
     Capture a screenshot of a webpage with advanced options.
 
@@ -231,65 +603,33 @@ def capture_screenshot(url, output_file="screenshot.png", full_page=False, delay
         wait_for_selector (str): CSS selector to wait for before capturing.
         timeout (int): Page load timeout in milliseconds.
         user_agent (str): Custom user agent string.
+        wait_until (str): Navigation event to wait for before continuing
+            (load, domcontentloaded, networkidle or commit).
+        block_resources (tuple): Resource types to abort (e.g. image, font).
+        block_trackers (bool): Abort requests to known tracker/ad hosts.
+        png_compress (int): zlib level (0-9) to re-encode PNGs with, or None
+            to keep Playwright's encoding.
+        post (tuple): Pixel post-processing steps to apply (invert, grayscale).
+        direct_io (bool): Write the file with O_DIRECT on Linux.
     """
+    from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
+    
+    if hide_cookie_banners:
+        print("🍪 Hiding cookie banners...")
+    
     with sync_playwright() as p:
         browser = p.chromium.launch(headless=True)
         
-        context_options = {
-            'viewport': {'width': viewport_width, 'height': viewport_height},
-            'device_scale_factor': scale
-        }
-        
-        if dark_mode:
-            context_options['color_scheme'] = 'dark'
-        
-        if user_agent:
-            context_options['user_agent'] = user_agent
-        
-        context = browser.new_context(**context_options)
-        page = context.new_page()
-        
         try:
-            print(f"🌐 Loading {url}...")
-            page.goto(url, timeout=timeout)
-            
-            if wait_for_selector:
-                print(f"⏳ Waiting for selector: {wait_for_selector}")
-                page.wait_for_selector(wait_for_selector, timeout=timeout)
-            
-            if hide_cookie_banners:
-                print("🍪 Hiding cookie banners...")
-                page.evaluate("""
-                    const selectors = [
-                        '[class*="cookie"]', '[id*="cookie"]',
-                        '[class*="consent"]', '[id*="consent"]',
-                        '[class*="gdpr"]', '[id*="gdpr"]',
-                        '[aria-label*="cookie"]', '[aria-label*="consent"]'
-                    ];
-                    selectors.forEach(sel => {
-                        document.querySelectorAll(sel).forEach(el => {
-                            if (el.offsetHeight > 50) el.style.display = 'none';
-                        });
-                    });
-                """)
-            
-            if delay > 0:
-                print(f"⏱️  Waiting {delay} seconds...")
-                time.sleep(delay)
-            
-            screenshot_options = {
-                'path': output_file,
-                'full_page': full_page
-            }
-            
-            if output_file.lower().endswith(('.jpg', '.jpeg')):
-                screenshot_options['type'] = 'jpeg'
-                screenshot_options['quality'] = quality
-            
-            page.screenshot(**screenshot_options)
-            file_size = os.path.getsize(output_file)
-            print(f"✅ Screenshot saved: {output_file} ({file_size:,} bytes)")
-            
+            _capture_on_browser(browser, url, output_file, full_page=full_page, delay=delay,
+                                viewport_width=viewport_width, viewport_height=viewport_height,
+                                quality=quality, scale=scale, dark_mode=dark_mode,
+                                hide_cookie_banners=hide_cookie_banners,
+                                wait_for_selector=wait_for_selector, timeout=timeout,
+                                user_agent=user_agent, wait_until=wait_until,
+                                block_resources=block_resources,
+                                block_trackers=block_trackers, png_compress=png_compress,
+                                post=post, direct_io=direct_io)
         except PlaywrightTimeoutError:
             print(f"❌ Error: Page took too long to load (timeout: {timeout}ms)")
         except Exception as e:
@@ -297,43 +637,511 @@ def capture_screenshot(url, output_file="screenshot.png", full_page=False, delay
         finally:
             browser.close()
 
-def batch_capture(file_path, **kwargs):
+def _batch_capture_shared(jobs, hide_cookie_banners=False, timeout=15000, **kwargs):
+    """
+    Capture an iterable of (url, output_file) jobs with a single browser.
+
+    Chromium is launched once; each URL gets a fresh context so cookies and
+    storage do not leak between captures. Returns the number of URLs processed.
+    """
+    from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
+    
+    if hide_cookie_banners:
+        print("🍪 Hiding cookie banners...")
+    
+    processed = 0
+    
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=True)
+        
+        try:
+            for url, output_file in jobs:
+                processed += 1
+                print(f"\n[{processed}] Processing: {url}")
+                
+                try:
+                    _capture_on_browser(browser, url, output_file,
+                                        hide_cookie_banners=hide_cookie_banners,
+                                        timeout=timeout, **kwargs)
+                except PlaywrightTimeoutError:
+                    print(f"❌ Error: Page took too long to load (timeout: {timeout}ms)")
+                except Exception as e:
+                    print(f"❌ Error: {str(e)}")
+        finally:
+            browser.close()
+    
+    return processed
+
+def _open_uring(depth):
+    """
+    Set up an io_uring for writing batches of up to depth files.
+
+    Returns write_batch(files), which queues one write SQE per (path, data)
+    file, submits them all with a single io_uring_submit call and returns
+    None for each file written and the OSError for each file that failed,
+    in input order; and close(), which tears the ring down. The ring is set
+    up once and reused for every batch.
+
+    liburing releases up to 2024 name the ring and CQE types io_uring and
+    io_uring_cqe and take an explicit byte count in io_uring_prep_write;
+    later ones call them Ring and Cqe and take the length from the buffer.
+    """
+    import liburing
+    
+    legacy_api = not hasattr(liburing, 'Ring')
+    if legacy_api:
+        ring, cqe = liburing.io_uring(), liburing.io_uring_cqe()
+    else:
+        ring, cqe = liburing.Ring(), liburing.Cqe()
+    
+    liburing.io_uring_queue_init(depth, ring, 0)
+    
+    def write_batch(files):
+        fds = {}
+        results = [None] * len(files)
+        
+        try:
+            for index, (path, data) in enumerate(files):
+                try:
+                    fds[index] = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                except OSError as e:
+                    results[index] = e
+                    continue
+                
+                sqe = liburing.io_uring_get_sqe(ring)
+                if legacy_api:
+                    liburing.io_uring_prep_write(sqe, fds[index], data, len(data), 0)
+                else:
+                    liburing.io_uring_prep_write(sqe, fds[index], data, 0)
+                liburing.io_uring_sqe_set_data64(sqe, index)
+            
+            submitted = liburing.io_uring_submit(ring)
+            
+            for _ in range(submitted):
+                liburing.io_uring_wait_cqe(ring, cqe)
+                entry = cqe[0]
+                index, res = liburing.io_uring_cqe_get_data64(entry), entry.res
+                liburing.io_uring_cqe_seen(ring, entry)
+                
+                path, data = files[index]
+                if res < 0:
+                    results[index] = OSError(-res, os.strerror(-res), path)
+                elif res < len(data):
+                    # Finish short writes synchronously
+                    os.pwrite(fds[index], data[res:], res)
+        finally:
+            for fd in fds.values():
+                os.close(fd)
+        
+        return results
+    
+    def close():
+        liburing.io_uring_queue_exit(ring)
+    
+    return write_batch, close
+
+def _save_queued(item):
+    """Save one queued (output_file, data, png_compress, post, quality, direct_io) screenshot."""
+    try:
+        _save_screenshot(*item)
+    except Exception as e:
+        print(f"❌ Error saving {item[0]}: {str(e)}")
+
+def _save_batch(files, write_batch=None):
+    """
+    Write a batch of encoded (path, data) files and report each one.
+
+    The files are written through write_batch (an io_uring from _open_uring)
+    when given, and with regular writes otherwise or if the ring fails.
+    Returns False when the ring failed so the caller stops using it.
+    """
+    results = None
+    
+    if write_batch:
+        try:
+            results = write_batch(files)
+        except Exception as e:
+            print(f"⚠️  io_uring write failed ({str(e)}), using regular writes")
+    
+    ring_ok = results is not None
+    
+    if results is None:
+        results = []
+        for path, data in files:
+            try:
+                _write_file(path, data)
+                results.append(None)
+            except OSError as e:
+                results.append(e)
+    
+    for (output_file, data), error in zip(files, results):
+        if error:
+            print(f"❌ Error saving {output_file}: {str(error)}")
+        else:
+            print(f"✅ Screenshot saved: {output_file} ({len(data):,} bytes)")
+    
+    return ring_ok
+
+def _start_writer(io_backend="posix", maxsize=8):
+    """
+    Start a background thread that encodes and writes screenshots.
+
+    Returns a save() function with the same signature as _save_screenshot
+    that queues a screenshot, and a stop() function that flushes the queue
+    and waits for the thread. The bounded queue caps how many screenshots sit
+    in memory.
+
+    With the "uring" backend the thread sets up one io_uring for its whole
+    lifetime and holds encoded screenshots back until maxsize of them are
+    ready (or stop() is called), then writes them with one submission. If
+    the ring fails, regular writes are used from then on. Should the thread
+    die, save() and stop() write on the caller's thread instead of blocking.
+    """
+    writer_queue = queue.Queue(maxsize=maxsize)
+    
+    def run():
+        write_batch = close_ring = None
+        if io_backend == "uring":
+            try:
+                write_batch, close_ring = _open_uring(maxsize)
+            except Exception as e:
+                print(f"⚠️  io_uring unavailable ({str(e)}), using regular writes")
+        
+        files = []
+        
+        try:
+            while True:
+                item = writer_queue.get()
+                
+                if item is not None and write_batch is None:
+                    _save_queued(item)
+                    continue
+                
+                if item is not None:
+                    output_file, data, png_compress, post, quality, _ = item
+                    try:
+                        files.append((output_file, _encode_screenshot(data, output_file,
+                                                                      png_compress, post,
+                                                                      quality)))
+                    except Exception as e:
+                        print(f"❌ Error saving {output_file}: {str(e)}")
+                
+                if files and (item is None or len(files) >= maxsize):
+                    if not _save_batch(files, write_batch):
+                        write_batch = None
+                    files = []
+                
+                if item is None:
+                    break
+        except Exception as e:
+            print(f"❌ Screenshot writer failed: {str(e)}")
+            _save_batch(files)
+        finally:
+            if close_ring:
+                try:
+                    close_ring()
+                except Exception:
+                    pass
+    
+    thread = threading.Thread(target=run, name="snaphero-writer", daemon=True)
+    thread.start()
+    
+    def put(item):
+        # Give up on the queue as soon as the thread is gone
+        while thread.is_alive():
+            try:
+                writer_queue.put(item, timeout=1)
+                return True
+            except queue.Full:
+                pass
+        return False
+    
+    def save(output_file, data, png_compress=None, post=(), quality=80, direct_io=False):
+        item = (output_file, data, png_compress, post, quality, direct_io)
+        if not put(item):
+            _save_queued(item)
+    
+    def stop():
+        put(None)
+        thread.join()
+        
+        # Save anything a failed writer thread left in the queue
+        while True:
+            try:
+                item = writer_queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None:
+                _save_queued(item)
+    
+    return save, stop
+
+def _batch_capture_pool(jobs, workers, **kwargs):
+    """
+    Capture an iterable of (url, output_file) jobs in a pool of processes.
+
+    Each worker runs capture_screenshot with its own browser. Only a few
+    jobs per worker are submitted ahead, so a lazy stream of jobs is never
+    read far past what is being captured. Returns the number of URLs processed.
+    """
+    from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, as_completed, wait
+    
+    processed = 0
+    pending = {}
+    
+    def finish(futures):
+        nonlocal processed
+        for future in futures:
+            future.result()
+            processed += 1
+            print(f"[{processed}] Finished: {pending.pop(future)}")
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for url, output_file in jobs:
+            if len(pending) >= workers * 2:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                finish(done)
+            
+            pending[executor.submit(capture_screenshot, url, output_file=output_file, **kwargs)] = url
+        
+        finish(as_completed(list(pending)))
+    
+    return processed
+
+def _url_domain(url):
+    """Return the host of a URL for batch filenames, without credentials or port."""
+    host = urlparse(url).hostname
+    
+    if not host:
+        # Scheme-less lines such as "example.org/page" have no netloc
+        host = url.split('//')[-1].split('/')[0].rpartition('@')[2].split(':')[0]
+    
+    # IPv6 literals contain colons, which are not valid in Windows filenames
+    return host.removeprefix('www.').replace(':', '_') or 'site'
+
+def _iter_urls(lines):
+    """Yield URLs from an iterable of lines, skipping blanks and # comments."""
+    for line in lines:
+        url = line.strip()
+        if url and not url.startswith('#'):
+            yield url
+
+def batch_capture(file_path: str, workers: int = 1, concurrency: int = 1,
+                  skip_existing: bool = False, io_backend: str = "posix", **kwargs: Any) -> None:
     """
     Capture screenshots for multiple URLs from a file.
 
+    The file is streamed line by line, so capturing starts right away and
+    no list of URLs or jobs is built up front. The only state that grows
+    with the file is the set of distinct URLs kept for de-duplication.
+
     Parameters:
         file_path (str): Path to file containing URLs (one per line).
+        workers (int): Number of URLs to capture in parallel (default: 1).
+        concurrency (int): Number of pages loaded concurrently in a single
+            browser via the async API (default: 1).
+        skip_existing (bool): Name files after a hash of each URL instead of
+            a timestamp and line number, and skip URLs whose screenshot
+            already exists, so batches can be resumed after editing the file.
+        io_backend (str): "posix" for one write() per file or "uring" to
+            batch writes through io_uring (default: posix).
         **kwargs: Additional arguments passed to capture_screenshot.
     """
-    try:
-        with open(file_path, 'r') as f:
-            urls = [line.strip() for line in f if line.strip() and not line.startswith('#')]
-        
-        if not urls:
-            print("❌ No valid URLs found in file.")
-            return
-        
-        print(f"\n📋 Found {len(urls)} URLs to capture\n")
-        prefix = kwargs.pop('batch_prefix', 'screenshot_')
+    import hashlib
+    from datetime import datetime
+    
+    prefix = kwargs.pop('batch_prefix', 'screenshot_')
+    
+    # Output filenames combine one batch timestamp with the URL's index, so
+    # names never collide even when captures run in parallel. Resumable
+    # batches name files after the URL itself, so a rerun maps each URL to
+    # its own screenshot even if lines were removed or added in between.
+    batch_tag = "_" + datetime.now().strftime("%Y%m%d_%H%M%S")
+    
+    def iter_jobs(urls):
+        seen = set()
         
         for i, url in enumerate(urls, 1):
-            print(f"\n[{i}/{len(urls)}] Processing: {url}")
+            # Drop duplicate URLs (ignoring a trailing slash) while keeping file
+            # order; the URL itself is loaded exactly as written in the file
+            key = url.rstrip('/')
+            if key in seen:
+                continue
+            seen.add(key)
+            
+            domain = _url_domain(url)
+            if skip_existing:
+                digest = hashlib.sha1(key.encode()).hexdigest()[:10]
+                output_file = f"{prefix}{domain}_{digest}.png"
+            else:
+                output_file = f"{prefix}{domain}{batch_tag}_{i:04d}.png"
             
-            # Generate output filename
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            domain = url.split('//')[-1].split('/')[0].replace('www.', '')
-            output_file = f"{prefix}{domain}_{timestamp}.png"
+            if skip_existing and os.path.exists(output_file):
+                print(f"⏭️  Skipping {url} ({output_file} exists)")
+                continue
+            
+            yield url, output_file
+    
+    try:
+        with open(file_path, 'r') as f:
+            jobs = iter_jobs(_iter_urls(f))
             
-            capture_screenshot(url, output_file=output_file, **kwargs)
+            if workers > 1:
+                print(f"⚙️  Using {workers} parallel workers")
+                processed = _batch_capture_pool(jobs, workers, **kwargs)
+            else:
+                # Encode and write on a background thread so disk I/O overlaps
+                # with rendering the next page
+                save, stop_writer = _start_writer(io_backend)
+                
+                try:
+                    if concurrency > 1:
+                        import asyncio
+                        from snaphero_async import batch_capture_async
+                        
+                        print(f"⚙️  Capturing up to {concurrency} pages concurrently")
+                        processed = asyncio.run(batch_capture_async(jobs, concurrency,
+                                                                    save=save, **kwargs))
+                    else:
+                        processed = _batch_capture_shared(jobs, save=save, **kwargs)
+                finally:
+                    stop_writer()
+        
+        if not processed:
+            print("❌ No URLs left to capture in file.")
+            return
         
-        print(f"\n🎉 Batch capture complete! Processed {len(urls)} URLs.")
+        print(f"\n🎉 Batch capture complete! Processed {processed} URLs.")
         
     except FileNotFoundError:
         print(f"❌ Error: File '{file_path}' not found.")
     except Exception as e:
         print(f"❌ Error reading file: {str(e)}")
 
-def parse_arguments():
+def serve(socket_path=None):
+    """
+    Keep one warm browser and serve capture requests over a Unix socket.
+
+    Each request is a newline-delimited JSON object holding capture_screenshot
+    arguments; each reply is a JSON line with "ok" and "output" or "error".
+    Requests are handled one at a time on the Playwright thread.
+
+    Parameters:
+        socket_path (str): Filesystem path of the Unix socket to listen on
+            (default: snaphero.sock in the temporary directory).
+    """
+    import json
+    import socket
+    import stat
+    from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
+    
+    socket_path = socket_path or _default_socket()
+    
+    if not hasattr(socket, 'AF_UNIX'):
+        print("❌ Error: Server mode requires Unix domain socket support")
+        sys.exit(1)
+    
+    # Only replace a stale socket: never a regular file or a live server
+    if os.path.lexists(socket_path):
+        if not stat.S_ISSOCK(os.lstat(socket_path).st_mode):
+            print(f"❌ Error: {socket_path} exists and is not a socket")
+            sys.exit(1)
+        
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            try:
+                probe.connect(socket_path)
+            except OSError:
+                os.unlink(socket_path)
+            else:
+                print(f"❌ Error: A SnapHero server is already listening on {socket_path}")
+                sys.exit(1)
+    
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=True)
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(socket_path)
+        server.listen()
+        print(f"🚀 SnapHero server listening on {socket_path}")
+        print(f"💡 Run: export SNAPHERO_SOCK={socket_path}")
+        
+        try:
+            while True:
+                conn, _ = server.accept()
+                # Don't let an idle client hold the server forever
+                conn.settimeout(SERVER_IDLE_TIMEOUT)
+                
+                # A client that hangs up, times out or sends garbage only
+                # loses its own connection, never the server
+                try:
+                    with conn, conn.makefile('r') as reader, conn.makefile('w') as writer:
+                        for line in reader:
+                            if not line.strip():
+                                continue
+                            
+                            try:
+                                params = json.loads(line)
+                                _capture_on_browser(browser, **params)
+                                reply = {'ok': True, 'output': params.get('output_file')}
+                            except PlaywrightTimeoutError:
+                                reply = {'ok': False, 'error': "Page took too long to load "
+                                         f"(timeout: {params.get('timeout', 15000)}ms)"}
+                            except Exception as e:
+                                reply = {'ok': False, 'error': str(e)}
+                            
+                            writer.write(json.dumps(reply) + "\n")
+                            writer.flush()
+                except (OSError, ValueError) as e:
+                    print(f"⚠️  Dropped client connection: {str(e) or type(e).__name__}")
+        except KeyboardInterrupt:
+            print("\n👋 Shutting down SnapHero server")
+        finally:
+            server.close()
+            os.unlink(socket_path)
+            browser.close()
+
+def _capture_via_server(socket_path, url, output_file="screenshot.png", **kwargs):
+    """
+    Ask a running SnapHero server to capture a URL.
+
+    Returns the decoded JSON reply. Raises OSError if the server cannot be
+    reached or closes the connection without a valid reply, so the caller
+    can fall back to a local capture. If the server accepts the request but
+    does not answer in time, a failed reply is returned instead: the server
+    may still be writing output_file, so capturing it locally would race.
+    """
+    import json
+    import socket
+    
+    if not hasattr(socket, 'AF_UNIX'):
+        raise OSError("Unix domain sockets are not supported on this platform")
+    
+    params = dict(kwargs, url=url, output_file=os.path.abspath(output_file))
+    
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.settimeout(5)
+        client.connect(socket_path)
+        client.sendall((json.dumps(params) + "\n").encode())
+        
+        # Navigation and the selector wait may each use the full page timeout
+        client.settimeout(2 * params.get('timeout', 15000) / 1000 + params.get('delay', 0) + 30)
+        try:
+            with client.makefile('r') as reader:
+                line = reader.readline()
+        except socket.timeout:
+            return {'ok': False, 'error': "Server did not reply in time; it may still be "
+                                          f"capturing {params['output_file']}"}
+    
+    try:
+        reply = json.loads(line)
+    except ValueError:
+        reply = None
+    
+    if not isinstance(reply, dict):
+        raise ConnectionError("server closed the connection without a valid reply")
+    
+    return reply
+
+def parse_arguments() -> argparse.Namespace:
     """Parse command-line arguments for SnapHero."""
     parser = argparse.ArgumentParser(
         description="SnapHero - Capture screenshots of web pages with advanced options.",
@@ -348,25 +1156,39 @@ def parse_arguments():
     parser.add_argument("--delay", type=float, default=0, help="Delay after page load in seconds (default: 0)")
     
     # Viewport options
-    parser.add_argument("--viewport-width", type=int, default=1280, help="Viewport width (default: 1280)")
-    parser.add_argument("--viewport-height", type=int, default=720, help="Viewport height (default: 720)")
-    parser.add_argument("--mobile", action="store_true", help="Use mobile viewport (375x667)")
-    parser.add_argument("--tablet", action="store_true", help="Use tablet viewport (768x1024)")
+    parser.add_argument("--viewport-width", type=int, help="Viewport width (default: 1280)")
+    parser.add_argument("--viewport-height", type=int, help="Viewport height (default: 720)")
+    device_group = parser.add_mutually_exclusive_group()
+    device_group.add_argument("--device", choices=list(DEVICE_PRESETS), help="Use a device viewport preset")
+    device_group.add_argument("--mobile", action="store_const", dest="device", const="mobile", help="Alias for --device mobile (375x667)")
+    device_group.add_argument("--tablet", action="store_const", dest="device", const="tablet", help="Alias for --device tablet (768x1024)")
     
     # Quality options
     parser.add_argument("--quality", type=int, default=80, help="JPEG quality 1-100 (default: 80)")
     parser.add_argument("--scale", type=float, default=1, help="Device scale factor (default: 1, use 2 for Retina)")
+    parser.add_argument("--direct-io", action="store_true", help="Write screenshots with O_DIRECT, bypassing the page cache (Linux only)")
+    parser.add_argument("--png-compress", type=int, help="Re-encode PNGs with Pillow at zlib level 0-9 (default: keep the browser's PNG)")
     
     # Advanced features
     parser.add_argument("--dark-mode", action="store_true", help="Enable dark mode")
+    parser.add_argument("--post", help="Comma-separated pixel post-processing steps: invert, grayscale")
     parser.add_argument("--hide-cookie-banners", action="store_true", help="Hide cookie consent banners")
     parser.add_argument("--wait-for-selector", help="Wait for CSS selector before capturing")
     parser.add_argument("--timeout", type=int, default=15000, help="Page load timeout in ms (default: 15000)")
+    parser.add_argument("--wait-until", choices=["load", "domcontentloaded", "networkidle", "commit"],
+                        help="Navigation event to wait for (default: domcontentloaded, or load with --full-page)")
     parser.add_argument("--user-agent", help="Custom user agent string")
+    parser.add_argument("--block-resources", help="Comma-separated resource types to block (e.g. image,font,media)")
+    parser.add_argument("--block-trackers", action="store_true", help="Block requests to common tracker and ad hosts")
     
     # Batch processing
     parser.add_argument("--batch", help="Batch capture from file (one URL per line)")
+    parser.add_argument("--serve", action="store_true", help="Run a persistent capture server on the $SNAPHERO_SOCK Unix socket")
     parser.add_argument("--batch-prefix", default="screenshot_", help="Prefix for batch files (default: screenshot_)")
+    parser.add_argument("--skip-existing", action="store_true", help="Skip URLs whose batch screenshot already exists (uses stable filenames)")
+    parser.add_argument("--io-backend", choices=["posix", "uring"], default="posix", help="How batch screenshots are written: posix or uring (Linux, requires liburing; not with --direct-io)")
+    parser.add_argument("--workers", type=int, default=1, help="Number of URLs to capture in parallel in batch mode (default: 1)")
+    parser.add_argument("--concurrency", type=int, default=1, help="Number of pages loaded concurrently in one browser in batch mode (default: 1)")
     
     # Information
     parser.add_argument("--manual", action="store_true", help="Show comprehensive manual")
@@ -375,7 +1197,7 @@ def parse_arguments():
     
     return parser.parse_args()
 
-def main():
+def main() -> None:
     """Main function to orchestrate SnapHero operations."""
     args = parse_arguments()
     
@@ -398,50 +1220,91 @@ def main():
     # Display banner
     show_banner()
     
-    # Handle mobile/tablet presets
-    if args.mobile:
-        args.viewport_width = 375
-        args.viewport_height = 667
-        print("📱 Using mobile viewport (375x667)")
+    # Resolve the viewport from a device preset or explicit dimensions
+    if args.device:
+        if args.viewport_width is not None or args.viewport_height is not None:
+            print("❌ Error: --device cannot be combined with --viewport-width/--viewport-height")
+            sys.exit(1)
+        
+        args.viewport_width, args.viewport_height = DEVICE_PRESETS[args.device]
+        print(f"📱 Using {args.device} viewport ({args.viewport_width}x{args.viewport_height})")
+    else:
+        if args.viewport_width is None:
+            args.viewport_width = DEFAULT_VIEWPORT[0]
+        if args.viewport_height is None:
+            args.viewport_height = DEFAULT_VIEWPORT[1]
     
-    if args.tablet:
-        args.viewport_width = 768
-        args.viewport_height = 1024
-        print("📱 Using tablet viewport (768x1024)")
+    # Full-page captures need images laid out; otherwise DOMContentLoaded is enough
+    if args.wait_until is None:
+        args.wait_until = "load" if args.full_page else "domcontentloaded"
     
     # Validate quality
     if not 1 <= args.quality <= 100:
         print("❌ Error: Quality must be between 1 and 100")
         sys.exit(1)
     
-    # Batch mode
-    if args.batch:
-        batch_capture(
-            args.batch,
-            full_page=args.full_page,
-            delay=args.delay,
-            viewport_width=args.viewport_width,
-            viewport_height=args.viewport_height,
-            quality=args.quality,
-            scale=args.scale,
-            dark_mode=args.dark_mode,
-            hide_cookie_banners=args.hide_cookie_banners,
-            wait_for_selector=args.wait_for_selector,
-            timeout=args.timeout,
-            user_agent=args.user_agent,
-            batch_prefix=args.batch_prefix
-        )
-        return
+    # Validate PNG compression level
+    if args.png_compress is not None and not 0 <= args.png_compress <= 9:
+        print("❌ Error: PNG compression level must be between 0 and 9")
+        sys.exit(1)
     
-    # Single capture mode
-    if not args.url:
-        print("❌ Error: --url is required for single capture mode")
-        print("💡 Use --help for usage, --manual for detailed docs, or --examples for examples")
+    # O_DIRECT is Linux-specific
+    if args.direct_io and not sys.platform.startswith('linux'):
+        print("⚠️  --direct-io is only supported on Linux, using regular writes")
+    
+    # Validate batch I/O backend, which is only used by single-worker batches
+    if args.io_backend == "uring" and args.batch and args.workers == 1 and not args.serve:
+        if not sys.platform.startswith('linux') or importlib.util.find_spec('liburing') is None:
+            print("❌ Error: --io-backend uring requires Linux and liburing: pip install liburing")
+            sys.exit(1)
+        
+        if args.direct_io:
+            print("❌ Error: --direct-io cannot be combined with --io-backend uring")
+            sys.exit(1)
+        
+        # The kernel or a seccomp policy may still refuse to set up a ring
+        try:
+            _, close_ring = _open_uring(1)
+            close_ring()
+        except Exception as e:
+            print(f"❌ Error: cannot set up io_uring ({str(e)}), use --io-backend posix")
+            sys.exit(1)
+    
+    # Validate post-processing steps
+    post: Sequence[str] = ()
+    if args.post:
+        post = tuple(step.strip() for step in args.post.split(',') if step.strip())
+        unknown = [step for step in post if step not in POST_PROCESSORS]
+        if unknown:
+            print(f"❌ Error: Unknown post-processing step(s): {', '.join(unknown)}")
+            print(f"💡 Valid steps: {', '.join(POST_PROCESSORS)}")
+            sys.exit(1)
+        
+        if any(importlib.util.find_spec(name) is None for name in ('numpy', 'PIL')):
+            print("❌ Error: --post requires NumPy and Pillow: pip install numpy Pillow")
+            sys.exit(1)
+    
+    # Validate blocked resource types
+    block_resources: Sequence[str] = ()
+    if args.block_resources:
+        block_resources = tuple(t.strip() for t in args.block_resources.split(',') if t.strip())
+        unknown = [t for t in block_resources if t not in RESOURCE_TYPES]
+        if unknown:
+            print(f"❌ Error: Unknown resource type(s): {', '.join(unknown)}")
+            print(f"💡 Valid types: {', '.join(RESOURCE_TYPES)}")
+            sys.exit(1)
+    
+    # Validate workers
+    if args.workers < 1:
+        print("❌ Error: Workers must be at least 1")
+        sys.exit(1)
+    
+    # Validate concurrency
+    if args.concurrency < 1:
+        print("❌ Error: Concurrency must be at least 1")
         sys.exit(1)
     
-    capture_screenshot(
-        url=args.url,
-        output_file=args.output,
+    capture_options = dict(
         full_page=args.full_page,
         delay=args.delay,
         viewport_width=args.viewport_width,
@@ -452,8 +1315,55 @@ def main():
         hide_cookie_banners=args.hide_cookie_banners,
         wait_for_selector=args.wait_for_selector,
         timeout=args.timeout,
-        user_agent=args.user_agent
+        user_agent=args.user_agent,
+        wait_until=args.wait_until,
+        block_resources=block_resources,
+        block_trackers=args.block_trackers,
+        png_compress=args.png_compress,
+        post=post,
+        direct_io=args.direct_io
     )
+    
+    # Server mode
+    if args.serve:
+        serve(os.environ.get('SNAPHERO_SOCK'))
+        return
+    
+    # Batch mode
+    if args.batch:
+        batch_capture(
+            args.batch,
+            batch_prefix=args.batch_prefix,
+            skip_existing=args.skip_existing,
+            io_backend=args.io_backend,
+            workers=args.workers,
+            concurrency=args.concurrency,
+            **capture_options
+        )
+        return
+    
+    # Single capture mode
+    if not args.url:
+        print("❌ Error: --url is required for single capture mode")
+        print("💡 Use --help for usage, --manual for detailed docs, or --examples for examples")
+        sys.exit(1)
+    
+    # Hand the capture to a running server when one is advertised
+    socket_path = os.environ.get('SNAPHERO_SOCK')
+    if socket_path:
+        try:
+            reply = _capture_via_server(socket_path, args.url, args.output, **capture_options)
+        except OSError as e:
+            print(f"⚠️  Server at {socket_path} unavailable ({e}), capturing locally")
+        else:
+            if reply.get('ok'):
+                file_size = os.path.getsize(reply['output'])
+                print(f"✅ Screenshot saved: {reply['output']} ({file_size:,} bytes)")
+            else:
+                print(f"❌ Error: {reply.get('error')}")
+            return
+    
+    capture_screenshot(args.url, output_file=args.output, **capture_options)
 
 if __name__ == "__main__":
     main()
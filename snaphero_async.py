@@ -0,0 +1,127 @@
+"""
+Async (Playwright async API) capture path used by SnapHero's --concurrency.
+
+Kept out of snaphero.py so that it is never compiled by mypyc, which
+mis-compiles an await inside a finally block nested in a try/except of a
+coroutine: a stale exception is re-raised after the page was captured.
+"""
+
+import asyncio
+
+from snaphero import (
+    HIDE_COOKIE_BANNERS_JS,
+    _build_context_options,
+    _is_jpeg,
+    _save_screenshot,
+    _should_block,
+)
+
+async def _setup_context_async(context, hide_cookie_banners=False, block_resources=(),
+                               block_trackers=False):
+    """Async counterpart of snaphero._setup_context."""
+    if hide_cookie_banners:
+        await context.add_init_script(HIDE_COOKIE_BANNERS_JS)
+    
+    if block_resources or block_trackers:
+        async def handle_route(route):
+            if _should_block(route.request, block_resources, block_trackers):
+                await route.abort()
+            else:
+                await route.continue_()
+        
+        await context.route("**/*", handle_route)
+
+async def _capture_on_page_async(page, url, output_file, full_page=False, delay=0, quality=80,
+                                 wait_for_selector=None, timeout=15000, wait_until="load",
+                                 png_compress=None, post=(), direct_io=False,
+                                 save=_save_screenshot):
+    """Async counterpart of snaphero._capture_on_page for use with the Playwright async API."""
+    print(f"🌐 Loading {url}...")
+    await page.goto(url, timeout=timeout, wait_until=wait_until)
+    
+    if wait_for_selector:
+        print(f"⏳ Waiting for selector: {wait_for_selector}")
+        await page.wait_for_selector(wait_for_selector, timeout=timeout)
+    
+    if delay > 0:
+        print(f"⏱️  Waiting {delay} seconds...")
+        await asyncio.sleep(delay)
+    
+    if _is_jpeg(output_file):
+        data = await page.screenshot(full_page=full_page, type='jpeg', quality=quality)
+    else:
+        data = await page.screenshot(full_page=full_page, type='png')
+    
+    # Hand off from a worker thread so a full writer queue (or a slow
+    # encode and write) never stalls the other pages on the event loop
+    await asyncio.get_running_loop().run_in_executor(
+        None, save, output_file, data, png_compress, post, quality, direct_io)
+
+async def batch_capture_async(jobs, concurrency, viewport_width=1280, viewport_height=720,
+                              scale=1, dark_mode=False, user_agent=None,
+                              hide_cookie_banners=False, block_resources=(),
+                              block_trackers=False, timeout=15000, **kwargs):
+    """
+    Capture an iterable of (url, output_file) jobs concurrently with the async API.
+
+    A single browser is shared and at most `concurrency` pages are loading at
+    any time, so network waits of different URLs overlap. Jobs are pulled
+    from the iterable only when a slot is free, so it may be a lazy stream.
+
+    Parameters:
+        jobs (iterable): (url, output_file) pairs to capture.
+        concurrency (int): Maximum number of pages captured at once.
+        **kwargs: Additional arguments passed to the per-page capture.
+
+    Returns:
+        int: Number of URLs processed.
+    """
+    from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
+    
+    context_options = _build_context_options(viewport_width, viewport_height, scale,
+                                             dark_mode, user_agent)
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    if hide_cookie_banners:
+        print("🍪 Hiding cookie banners...")
+    
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        
+        async def capture_one(url, output_file):
+            try:
+                context = await browser.new_context(**context_options)
+                
+                try:
+                    await _setup_context_async(context, hide_cookie_banners, block_resources,
+                                               block_trackers)
+                    page = await context.new_page()
+                    await _capture_on_page_async(page, url, output_file,
+                                                 timeout=timeout, **kwargs)
+                finally:
+                    await context.close()
+            except PlaywrightTimeoutError:
+                print(f"❌ Error ({url}): Page took too long to load (timeout: {timeout}ms)")
+            except Exception as e:
+                print(f"❌ Error ({url}): {str(e)}")
+            finally:
+                semaphore.release()
+        
+        processed = 0
+        running = set()
+        
+        try:
+            for url, output_file in jobs:
+                # Only read the next job once a capture slot is free
+                await semaphore.acquire()
+                processed += 1
+                print(f"\n[{processed}] Processing: {url}")
+                task = asyncio.create_task(capture_one(url, output_file))
+                running.add(task)
+                task.add_done_callback(running.discard)
+            
+            await asyncio.gather(*running)
+        finally:
+            await browser.close()
+    
+    return processed
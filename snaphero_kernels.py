@@ -0,0 +1,44 @@
+"""
+In-place RGBA pixel kernels used by SnapHero's --post option.
+
+The kernels are JIT-compiled with Numba when it is installed and fall back
+to vectorised NumPy otherwise. Numba caches the compiled machine code next
+to this file, so only the very first run pays the compilation cost.
+
+This module is kept out of snaphero.py so that it is never compiled by
+mypyc: Numba can only JIT plain Python functions.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:
+    def invert(pixels):
+        pixels[..., :3] = 255 - pixels[..., :3]
+
+    def grayscale(pixels):
+        luma = pixels[..., 0] * 0.299 + pixels[..., 1] * 0.587 + pixels[..., 2] * 0.114
+        pixels[..., :3] = luma.astype(np.uint8)[..., np.newaxis]
+else:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def invert(pixels):
+        for i in prange(pixels.shape[0]):
+            for j in range(pixels.shape[1]):
+                for c in range(3):
+                    pixels[i, j, c] = 255 - pixels[i, j, c]
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def grayscale(pixels):
+        for i in prange(pixels.shape[0]):
+            for j in range(pixels.shape[1]):
+                luma = np.uint8(pixels[i, j, 0] * 0.299 + pixels[i, j, 1] * 0.587
+                                + pixels[i, j, 2] * 0.114)
+                pixels[i, j, 0] = luma
+                pixels[i, j, 1] = luma
+                pixels[i, j, 2] = luma
+
+KERNELS = {
+    'invert': invert,
+    'grayscale': grayscale,
+}